@@ -1,12 +1,26 @@
+import importlib
+
+# Submodules are imported on first access so that importing one module
+#   (e.g. openet.core.utils) doesn't load all of the others
 # from . import api
-from . import landsat
-from . import common
-from . import ensemble
-from . import interpolate
-from . import utils
-from . import wrs2
+_SUBMODULES = {'common', 'ensemble', 'interpolate', 'landsat', 'utils', 'wrs2'}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    # Read the version from the package metadata on first access instead of at import
+    #   since the metadata lookup has to scan the installed distributions
+    elif name == '__version__':
+        from importlib import metadata
+        version = metadata.version(__package__.replace('.', '-') or __name__.replace('.', '-'))
+        # version = metadata.version('openet-core')
+        globals()['__version__'] = version
+        return version
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
-from importlib import metadata
 
-__version__ = metadata.version(__package__.replace('.', '-') or __name__.replace('.', '-'))
-# __version__ = metadata.version('openet-core')
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES | {'__version__'})
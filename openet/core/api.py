@@ -1,9 +1,16 @@
 # import sys
+import importlib
 
 import ee
 
 # import openet.interp as interp
 
+# ET model modules that can be loaded by collection()
+ET_MODELS = {
+    'ndvi': 'openet.ndvi',
+    'ssebop': 'openet.ssebop',
+}
+
 
 # class API():
 #     """"""
@@ -58,52 +65,17 @@ def collection(
     """
 
     # Load the ET model
-    if et_model.lower() == 'ndvi':
-
-        # # DEADBEEF - Manually adding OpenET Model to system path
-        # # This will eventually be handled by import openet modules
-        # import os
-        # model_path = os.path.dirname(os.path.dirname(os.path.dirname(
-        #     os.path.abspath(os.path.realpath(__file__)))))
-        # print(model_path)
-        # sys.path.insert(0, os.path.join(model_path, 'openet-ndvi-test'))
-        # print(sys.path)
-
-        try:
-            import openet.ndvi as model
-        except ModuleNotFoundError:
-            print(
-                '\nThe ET model {} could not be imported'.format(et_model) +
-                '\nPlease ensure that the model has been installed')
-            return False
-        except Exception as e:
-            print('Unhandled Exception: {}'.format(e))
-            raise
-
-    elif et_model.lower() == 'ssebop':
-
-        # # DEADBEEF - Manually adding OpenET Models to system path
-        # # This will eventually be handled by import openet modules
-        # import os
-        # model_path = os.path.dirname(os.path.dirname(os.path.dirname(
-        #     os.path.abspath(os.path.realpath(__file__)))))
-        # print(model_path)
-        # sys.path.insert(0, os.path.join(model_path, 'openet-ssebop-test'))
-
-        try:
-            import openet.ssebop as model
-        except ModuleNotFoundError:
-            print(
-                '\nThe ET model {} could not be imported'.format(et_model) +
-                '\nPlease ensure that the model has been installed')
-            return False
-        except Exception as e:
-            print('Unhandled Exception: {}'.format(e))
-            raise
-
-    else:
-        # CGM - This could just be a value error exception
+    # Modules that have already been imported are returned from sys.modules
+    module_name = ET_MODELS.get(et_model.lower())
+    if module_name is None:
         raise ValueError('unsupported et_model type')
+    try:
+        model = importlib.import_module(module_name)
+    except ModuleNotFoundError:
+        print(
+            '\nThe ET model {} could not be imported'.format(et_model) +
+            '\nPlease ensure that the model has been installed')
+        return False
 
     variable_coll = model.collection(
         variable,
@@ -1,7 +1,66 @@
+import math
+import warnings
+
 import ee
 
 from . import landsat
 
+# Constants for the Landsat Collection 2 LST correction
+# These are kept as Python objects since EE objects can't be built until
+#   the EE library has been initialized
+ASTER_GED_ID = 'NASA/ASTER_GED/AG100_003'
+
+# K1, K2 thermal conversion constants and
+#   c13, c14, and c regression coefficients from Malakar et al. (2018)
+# Landsat 9 regression coefficients are copied from L8
+LST_COEFFICIENTS = {
+    'LANDSAT_4': {'k1': 607.76, 'k2': 1260.56, 'c13': 0.3222, 'c14': 0.6498, 'c': 0.0272},
+    'LANDSAT_5': {'k1': 607.76, 'k2': 1260.56, 'c13': -0.0723, 'c14': 1.0521, 'c': 0.0195},
+    'LANDSAT_7': {'k1': 666.09, 'k2': 1282.71, 'c13': 0.2147, 'c14': 0.7789, 'c': 0.0058},
+    'LANDSAT_8': {'k1': 774.8853, 'k2': 1321.0789, 'c13': 0.6820, 'c14': 0.2578, 'c': 0.0584},
+    'LANDSAT_9': {'k1': 799.0284, 'k2': 1329.0284, 'c13': 0.7689, 'c14': 0.1843, 'c': 0.0457},
+}
+
+# Landsat Collection 2 Tier 1 collections for matching the input image
+# The Landsat 8 radiance images are matched to the real time collection
+C2_L2_COLL_IDS = {
+    'LANDSAT_4': 'LANDSAT/LT04/C02/T1_L2',
+    'LANDSAT_5': 'LANDSAT/LT05/C02/T1_L2',
+    'LANDSAT_7': 'LANDSAT/LE07/C02/T1_L2',
+    'LANDSAT_8': 'LANDSAT/LC08/C02/T1_L2',
+    'LANDSAT_9': 'LANDSAT/LC09/C02/T1_L2',
+}
+C2_RADIANCE_COLL_IDS = {
+    'LANDSAT_4': 'LANDSAT/LT04/C02/T1',
+    'LANDSAT_5': 'LANDSAT/LT05/C02/T1',
+    'LANDSAT_7': 'LANDSAT/LE07/C02/T1',
+    'LANDSAT_8': 'LANDSAT/LC08/C02/T1_RT',
+    'LANDSAT_9': 'LANDSAT/LC09/C02/T1',
+}
+
+# Radiance image band names and thermal band rescaling property names
+C2_RADIANCE_BANDS = {
+    'LANDSAT_4': ['B1', 'B2', 'B3', 'B4', 'B5', 'B7', 'B6'],
+    'LANDSAT_5': ['B1', 'B2', 'B3', 'B4', 'B5', 'B7', 'B6'],
+    'LANDSAT_7': ['B1', 'B2', 'B3', 'B4', 'B5', 'B7', 'B6_VCID_1'],
+    'LANDSAT_8': ['B2', 'B3', 'B4', 'B5', 'B6', 'B7', 'B10'],
+    'LANDSAT_9': ['B2', 'B3', 'B4', 'B5', 'B6', 'B7', 'B10'],
+}
+C2_RADIANCE_ADD_THERMAL_PROPERTIES = {
+    'LANDSAT_4': 'RADIANCE_ADD_BAND_6',
+    'LANDSAT_5': 'RADIANCE_ADD_BAND_6',
+    'LANDSAT_7': 'RADIANCE_ADD_BAND_6_VCID_1',
+    'LANDSAT_8': 'RADIANCE_ADD_BAND_10',
+    'LANDSAT_9': 'RADIANCE_ADD_BAND_10',
+}
+C2_RADIANCE_MULT_THERMAL_PROPERTIES = {
+    'LANDSAT_4': 'RADIANCE_MULT_BAND_6',
+    'LANDSAT_5': 'RADIANCE_MULT_BAND_6',
+    'LANDSAT_7': 'RADIANCE_MULT_BAND_6_VCID_1',
+    'LANDSAT_8': 'RADIANCE_MULT_BAND_10',
+    'LANDSAT_9': 'RADIANCE_MULT_BAND_10',
+}
+
 
 def landsat_c2_sr_cloud_mask(
         input_img,
@@ -78,36 +137,98 @@ def landsat_c2_sr_cloud_mask(
     if filter_flag:
         mask_img = (
             mask_img
-            .reduceNeighborhood(ee.Reducer.min(), ee.Kernel.circle(radius=1, units='pixels'))
-            .reduceNeighborhood(ee.Reducer.max(), ee.Kernel.circle(radius=2, units='pixels'))
-            # .reduceNeighborhood(ee.Reducer.max(), ee.Kernel.circle(radius=1, units='pixels'))
+            .focal_min(radius=1, kernelType='circle', units='pixels')
+            .focal_max(radius=2, kernelType='circle', units='pixels')
+            # .focal_max(radius=1, kernelType='circle', units='pixels')
             # .reproject(input_img.projection())
         )
 
     # Apply other cloud masks
+    # The masks are combined with a single band reduction instead of chaining Or() calls
+    # Reducing the bands of one image (instead of an image collection)
+    #   keeps the projection of the input masks
+    # Image.reduce() skips masked bands, so the minimum of the input masks is
+    #   reapplied to keep the Or() behavior of masking the output if any input is masked
+    mask_list = [mask_img]
     if cloud_score_flag:
-        mask_img = mask_img.Or(landsat.c02_cloud_score_mask(input_img, cloud_score_pct))
+        mask_list.append(landsat.c02_cloud_score_mask(input_img, cloud_score_pct))
     if saturated_flag:
-        mask_img = mask_img.Or(landsat.c02_qa_radsat_mask(input_img))
+        mask_list.append(landsat.c02_qa_radsat_mask(input_img))
     if sr_cloud_qa_flag:
-        mask_img = mask_img.Or(landsat.c02_sr_cloud_qa_mask(input_img))
+        # The SR_CLOUD_QA mask function returns an all zero (unmasked) image
+        #   for Landsat 8/9 since the band is only in the Landsat 4/5/7 images
+        mask_list.append(landsat.c02_l2_sr_cloud_qa_mask(input_img))
         # # Should the QA_PIXEL flags be passed through to the function also?
         # sr_cloud_qa_mask = landsat.c02_l2_sr_cloud_qa_mask(
         #     input_img, adjacent_flag=dilate_flag, shadow_flag=shadow_flag, snow_flag=snow_flag
         # )
-        # mask_img = mask_img.Or(sr_cloud_qa_mask)
+        # mask_list.append(sr_cloud_qa_mask)
+    if len(mask_list) > 1:
+        mask_img = ee.Image.cat(mask_list)
+        mask_img = (
+            mask_img.reduce(ee.Reducer.anyNonZero())
+            .updateMask(mask_img.mask().reduce(ee.Reducer.min()))
+        )
 
     # Flip to set cloudy pixels to 0 and clear to 1 for an updateMask() call
     return mask_img.Not().rename(['cloud_mask'])
 
 
-def sentinel2_toa_cloud_mask(input_img):
-    """Extract cloud mask from the Sentinel 2 TOA QA60 band
+def landsat_c2_sr_cloud_mask_np(
+        qa_pixel,
+        cirrus_flag=False,
+        dilate_flag=False,
+        shadow_flag=True,
+        snow_flag=False,
+        water_flag=False,
+        ):
+    """Compute cloud mask from a local Landsat Coll. 2 QA_PIXEL array
+
+    Parameters
+    ----------
+    qa_pixel : numpy.ndarray, int
+        Landsat Collection 2 QA_PIXEL values (e.g. read from a downloaded raster).
+    cirrus_flag : bool
+        If true, mask cirrus pixels (the default is False).
+        Note, cirrus bits are only set for Landsat 8/9 images.
+    dilate_flag : bool
+        If true, mask dilated cloud pixels (the default is False).
+    shadow_flag : bool
+        If true, mask shadow pixels (the default is True).
+    snow_flag : bool
+        If true, mask snow pixels (the default is False).
+    water_flag : bool
+        If true, mask water pixels (the default is False).
+
+    Returns
+    -------
+    numpy.ndarray, bool
+
+    Notes
+    -----
+    Output is True for clear pixels and False for cloud/masked pixels,
+        matching the QA_PIXEL mask in landsat_c2_sr_cloud_mask()
+        without the filter, cloud score, saturated, or SR_CLOUD_QA options
+
+    """
+    bitmask = landsat.c02_qa_pixel_bitmask(
+        cirrus_flag=cirrus_flag,
+        dilate_flag=dilate_flag,
+        shadow_flag=shadow_flag,
+        snow_flag=snow_flag,
+        water_flag=water_flag,
+    )
+    return (qa_pixel & bitmask) == 0
+
+
+def sentinel2_cloud_mask(input_img):
+    """Extract cloud mask from the Sentinel 2 QA60 band
 
     Parameters
     ----------
     input_img : ee.Image
-        Image from the COPERNICUS/S2 collection with a QA60 band.
+        Image from a Sentinel 2 collection with a QA60 band
+        (e.g. COPERNICUS/S2_HARMONIZED).
 
     Returns
     -------
@@ -122,7 +243,8 @@ def sentinel2_toa_cloud_mask(input_img):
         10: Opaque clouds present
         11: Cirrus clouds present
 
-    The Sentinel 2 TOA and SR cloud masks functions are currently identical
+    The Sentinel 2 SR cloud mask function will use the MSK_CLDPRB band
+        if the QA60 band is not present
 
     References
     ----------
@@ -130,12 +252,35 @@ def sentinel2_toa_cloud_mask(input_img):
     https://sentinel.esa.int/web/sentinel/technical-guides/sentinel-2-msi/level-1c/cloud-masks
 
     """
-    qa_img = input_img.select(['QA60'])
-    cloud_mask = qa_img.rightShift(10).bitwiseAnd(1).neq(0)\
-        .Or(qa_img.rightShift(11).bitwiseAnd(1).neq(0))
-
+    # Test the opaque and cirrus bits with a single bitwiseAnd call
     # Set cloudy pixels to 0 and clear to 1
-    return cloud_mask.Not().rename(['cloud_mask'])
+    return (
+        input_img.select(['QA60'])
+        .bitwiseAnd((1 << 10) | (1 << 11)).eq(0)
+        .rename(['cloud_mask'])
+    )
+
+
+def sentinel2_toa_cloud_mask(input_img):
+    """Extract cloud mask from the Sentinel 2 TOA QA60 band
+
+    This function is deprecated, use sentinel2_cloud_mask() instead
+
+    Parameters
+    ----------
+    input_img : ee.Image
+        Image from the COPERNICUS/S2 collection with a QA60 band.
+
+    Returns
+    -------
+    ee.Image
+
+    """
+    warnings.warn(
+        'sentinel2_toa_cloud_mask() is deprecated, use sentinel2_cloud_mask() instead',
+        DeprecationWarning, stacklevel=2
+    )
+    return sentinel2_cloud_mask(input_img)
 
 
 def sentinel2_sr_cloud_mask(input_img):
@@ -144,7 +289,8 @@ def sentinel2_sr_cloud_mask(input_img):
     Parameters
     ----------
     input_img : ee.Image
-        Image from the COPERNICUS/S2_SR collection with a QA60 band.
+        Image from the COPERNICUS/S2_SR collection with a QA60 band
+        or a MSK_CLDPRB band.
 
     Returns
     -------
@@ -159,7 +305,8 @@ def sentinel2_sr_cloud_mask(input_img):
         10: Opaque clouds present
         11: Cirrus clouds present
 
-    The Sentinel 2 TOA and SR cloud masks functions are currently identical
+    If the QA60 band is not present, pixels with a MSK_CLDPRB cloud probability
+        greater than or equal to 50 will be set as cloud
 
     References
     ----------
@@ -167,15 +314,18 @@ def sentinel2_sr_cloud_mask(input_img):
     https://sentinel.esa.int/web/sentinel/technical-guides/sentinel-2-msi/level-1c/cloud-masks
 
     """
-    qa_img = input_img.select(['QA60'])
-    cloud_mask = qa_img.rightShift(10).bitwiseAnd(1).neq(0)\
-        .Or(qa_img.rightShift(11).bitwiseAnd(1).neq(0))
-
+    # Fall back to the cloud probability band if the QA60 band is not present
     # Set cloudy pixels to 0 and clear to 1
-    return cloud_mask.Not().rename(['cloud_mask'])
+    cloud_mask = ee.Algorithms.If(
+        input_img.bandNames().contains('QA60'),
+        sentinel2_cloud_mask(input_img),
+        input_img.select(['MSK_CLDPRB']).lt(50),
+    )
 
+    return ee.Image(cloud_mask).rename(['cloud_mask'])
 
-def landsat_c2_sr_lst_correct(sr_image, ndvi):
+
+def landsat_c2_sr_lst_correct(sr_image, ndvi, image_extent=None):
     """Apply correction to Collection 2 LST using adjusted ASTER emissivity
 
     Parameters
@@ -186,6 +336,10 @@ def landsat_c2_sr_lst_correct(sr_image, ndvi):
         (e.g. LANDSAT/LC08/C02/T1_L2).
     ndvi : ee.Image
         Normalized difference vegetation index (NDVI)
+    image_extent : list, tuple, optional
+        Image extent as [xmin, ymin, xmax, ymax] in EPSG:4326 (the default is None).
+        If set, the ASTER GED clip extent will be snapped to the ASTER GED grid
+        client side instead of computing it from the image geometry.
 
     Returns
     -------
@@ -209,26 +363,42 @@ def landsat_c2_sr_lst_correct(sr_image, ndvi):
     """
     spacecraft_id = ee.String(sr_image.get('SPACECRAFT_ID'))
 
-    # Landsat image geometry for clipping ASTER GED
-    image_geom = sr_image.geometry()
-    image_extent = image_geom.bounds(1, 'EPSG:4326')
-
-    # # Simple clip extent from image geometry bounds
-    # clip_extent = image_geom.bounds(1, 'EPSG:4326')
-
-    # # Server side approach for getting image extent snapped to the ASTER GED grid
     buffer_cells = 1
     cellsize = 0.1
-    image_xy = ee.Array(image_extent.coordinates().get(0)).transpose().toList()
-    xmin = ee.Number(ee.List(image_xy.get(0)).reduce(ee.Reducer.min()))
-    ymin = ee.Number(ee.List(image_xy.get(1)).reduce(ee.Reducer.min()))
-    xmax = ee.Number(ee.List(image_xy.get(0)).reduce(ee.Reducer.max()))
-    ymax = ee.Number(ee.List(image_xy.get(1)).reduce(ee.Reducer.max()))
-    xmin = xmin.divide(cellsize * buffer_cells).floor().multiply(cellsize * buffer_cells)
-    ymin = ymin.divide(cellsize * buffer_cells).floor().multiply(cellsize * buffer_cells)
-    xmax = xmax.divide(cellsize * buffer_cells).ceil().multiply(cellsize * buffer_cells)
-    ymax = ymax.divide(cellsize * buffer_cells).ceil().multiply(cellsize * buffer_cells)
-    clip_extent = ee.Geometry.Rectangle([xmin, ymin, xmax, ymax], 'EPSG:4326', False)
+    snap = cellsize * buffer_cells
+
+    if image_extent is not None:
+        # Client side approach for snapping a known image extent to the ASTER GED grid
+        xmin, ymin, xmax, ymax = image_extent
+        clip_extent = ee.Geometry.Rectangle(
+            [
+                math.floor(xmin / snap) * snap, math.floor(ymin / snap) * snap,
+                math.ceil(xmax / snap) * snap, math.ceil(ymax / snap) * snap,
+            ],
+            'EPSG:4326', False
+        )
+    else:
+        # Landsat image geometry for clipping ASTER GED
+        image_geom = sr_image.geometry()
+        image_bounds = image_geom.bounds(1, 'EPSG:4326')
+
+        # # Simple clip extent from image geometry bounds
+        # clip_extent = image_geom.bounds(1, 'EPSG:4326')
+
+        # # Server side approach for getting image extent snapped to the ASTER GED grid
+        # The bounds polygon is an axis aligned rectangle starting at the lower left corner,
+        #   so the min and max coordinates can be read directly from opposite corners
+        #   instead of reducing the transposed coordinate array
+        image_coords = ee.List(image_bounds.coordinates().get(0))
+        xmin = ee.Number(ee.List(image_coords.get(0)).get(0))
+        ymin = ee.Number(ee.List(image_coords.get(0)).get(1))
+        xmax = ee.Number(ee.List(image_coords.get(2)).get(0))
+        ymax = ee.Number(ee.List(image_coords.get(2)).get(1))
+        xmin = xmin.divide(snap).floor().multiply(snap)
+        ymin = ymin.divide(snap).floor().multiply(snap)
+        xmax = xmax.divide(snap).ceil().multiply(snap)
+        ymax = ymax.divide(snap).ceil().multiply(snap)
+        clip_extent = ee.Geometry.Rectangle([xmin, ymin, xmax, ymax], 'EPSG:4326', False)
 
     # Landsat image projection for resample/reproject (
     # image_proj = sr_image.projection()
@@ -237,159 +407,120 @@ def landsat_c2_sr_lst_correct(sr_image, ndvi):
 
     # Aster Global Emissivity Dataset
 
-    ged = ee.Image('NASA/ASTER_GED/AG100_003').clip(clip_extent)
+    ged = ee.Image(ASTER_GED_ID).clip(clip_extent)
 
     veg_emis = 0.99
     soil_emiss_fill = 0.97
 
-    # Set K1, K2 values
-    k1 = ee.Dictionary({
-        'LANDSAT_4': 607.76, 'LANDSAT_5': 607.76, 'LANDSAT_7': 666.09,
-        'LANDSAT_8': 774.8853, 'LANDSAT_9': 799.0284,
-    })
-    k2 = ee.Dictionary({
-        'LANDSAT_4': 1260.56, 'LANDSAT_5': 1260.56, 'LANDSAT_7': 1282.71,
-        'LANDSAT_8': 1321.0789, 'LANDSAT_9': 1329.0284,
-    })
-
-    # Set c13, c14, and c regression coefficients from Malakar et al. (2018)
-    # Landsat 9 coefficients are copied from L8
-    c13 = ee.Dictionary({
-        'LANDSAT_4': 0.3222, 'LANDSAT_5': -0.0723, 'LANDSAT_7': 0.2147,
-        'LANDSAT_8': 0.6820, 'LANDSAT_9': 0.7689,
-    })
-    c14 = ee.Dictionary({
-        'LANDSAT_4': 0.6498, 'LANDSAT_5': 1.0521, 'LANDSAT_7': 0.7789,
-        'LANDSAT_8': 0.2578, 'LANDSAT_9': 0.1843,
-    })
-    c = ee.Dictionary({
-        'LANDSAT_4': 0.0272, 'LANDSAT_5': 0.0195, 'LANDSAT_7': 0.0058,
-        'LANDSAT_8': 0.0584, 'LANDSAT_9': 0.0457,
-    })
-
-    def get_matched_c2_t1_image(input_img):
-        # Find matching Landsat Collection 2 Tier 1 Level 2 image
-        #   based on the "LANDSAT_PRODUCT_ID" property
-        # Build the system:index format scene ID from the LANDSAT_PRODUCT_ID
-        scene_id = ee.List(ee.String(input_img.get('LANDSAT_PRODUCT_ID')).split('_'))
-        scene_id = (
-            ee.String(scene_id.get(0)).cat('_').cat(ee.String(scene_id.get(2)))
-            .cat('_').cat(ee.String(scene_id.get(3)))
+    # Get the K1, K2, c13, c14, and c values for the spacecraft with a single lookup
+    coefficients = ee.Dictionary(ee.Dictionary(LST_COEFFICIENTS).get(spacecraft_id))
+    k1 = ee.Number(coefficients.get('k1'))
+    k2 = ee.Number(coefficients.get('k2'))
+    c13 = ee.Number(coefficients.get('c13'))
+    c14 = ee.Number(coefficients.get('c14'))
+    c = ee.Number(coefficients.get('c'))
+
+    def fractional_cover(ndvi_img, scale=1.0):
+        # Linear rescale of NDVI to fractional cover (Eq. 4 of Allen-Kilic)
+        # The scale is applied in the expression so the rescale is a single call
+        return (
+            ndvi_img
+            .expression('(ndvi * scale - 0.15) / 0.65', {'ndvi': ndvi_img, 'scale': scale})
+            .clamp(0, 1.0)
         )
-        # scene_id = ee.String(input_img.get('system:index'))
 
-        # Testing if it is any faster to filter each collection separately
+    def get_matched_c2_t1_image(input_img, scene_id):
+        # Find matching Landsat Collection 2 Tier 1 Level 2 image
+        #   based on the system:index format scene ID
+
+        # Only filter the collection for the image spacecraft
+        #   instead of filtering and merging all of the Landsat collections
         # TODO: Test if adding an extra .filterDate() call helps
+        l2_colls = ee.Dictionary({k: ee.ImageCollection(v) for k, v in C2_L2_COLL_IDS.items()})
         return ee.Image(
-            ee.ImageCollection('LANDSAT/LC09/C02/T1_L2')
+            ee.ImageCollection(l2_colls.get(input_img.get('SPACECRAFT_ID')))
             .filter(ee.Filter.eq('system:index', scene_id))
-            .merge(ee.ImageCollection('LANDSAT/LC08/C02/T1_L2')
-                   .filter(ee.Filter.eq('system:index', scene_id)))
-            .merge(ee.ImageCollection('LANDSAT/LE07/C02/T1_L2')
-                   .filter(ee.Filter.eq('system:index', scene_id)))
-            .merge(ee.ImageCollection('LANDSAT/LT05/C02/T1_L2')
-                   .filter(ee.Filter.eq('system:index', scene_id)))
-            .merge(ee.ImageCollection('LANDSAT/LT04/C02/T1_L2')
-                   .filter(ee.Filter.eq('system:index', scene_id)))
             .first()
         )
 
-    def get_matched_c2_t1_radiance_image(input_img):
-        # Find matching Landsat Collection 2 Tier 1 Level 2 image
-        #   based on the "LANDSAT_PRODUCT_ID" property
-        # Build the system:index format scene ID from the LANDSAT_PRODUCT_ID
+    def get_matched_c2_t1_radiance_image(input_img, scene_id):
+        # Find matching Landsat Collection 2 Tier 1 radiance image
+        #   based on the system:index format scene ID
         satellite = ee.String(input_img.get('SPACECRAFT_ID'))
-        scene_id = ee.List(ee.String(input_img.get('LANDSAT_PRODUCT_ID')).split('_'))
-        scene_id = (
-            ee.String(scene_id.get(0)).cat('_').cat(ee.String(scene_id.get(2)))
-            .cat('_').cat(ee.String(scene_id.get(3)))
-        )
-        # scene_id = ee.String(input_img.get('system:index'))
 
         # TODO: Fix error when images that are in the T1_L2 collections but not in the T1,
         #  will fail with a .get() error because matched_img is 'None',
         #  could cause issues if trying to map over a collection
 
-        #  Testing if it is any faster to filter each collection separately
+        # Only filter the collection for the image spacecraft
+        #   instead of filtering and merging all of the Landsat collections
         # TODO: Test if adding an extra .filterDate() call helps
+        radiance_colls = ee.Dictionary({
+            k: ee.ImageCollection(v) for k, v in C2_RADIANCE_COLL_IDS.items()
+        })
         matched_img = ee.Image(
-            ee.ImageCollection('LANDSAT/LC09/C02/T1')
+            ee.ImageCollection(radiance_colls.get(satellite))
             .filter(ee.Filter.eq('system:index', scene_id))
-            .merge(ee.ImageCollection('LANDSAT/LC08/C02/T1_RT')
-                   .filter(ee.Filter.eq('system:index', scene_id)))
-            .merge(ee.ImageCollection('LANDSAT/LE07/C02/T1')
-                   .filter(ee.Filter.eq('system:index', scene_id)))
-            .merge(ee.ImageCollection('LANDSAT/LT05/C02/T1')
-                   .filter(ee.Filter.eq('system:index', scene_id)))
-            .merge(ee.ImageCollection('LANDSAT/LT04/C02/T1')
-                   .filter(ee.Filter.eq('system:index', scene_id)))
             .first()
         )
 
-        input_bands = ee.Dictionary({
-            'LANDSAT_4': ['B1', 'B2', 'B3', 'B4', 'B5', 'B7', 'B6'],
-            'LANDSAT_5': ['B1', 'B2', 'B3', 'B4', 'B5', 'B7', 'B6'],
-            'LANDSAT_7': ['B1', 'B2', 'B3', 'B4', 'B5', 'B7', 'B6_VCID_1'],
-            'LANDSAT_8': ['B2', 'B3', 'B4', 'B5', 'B6', 'B7', 'B10'],
-            'LANDSAT_9': ['B2', 'B3', 'B4', 'B5', 'B6', 'B7', 'B10'],
-        })
+        input_bands = ee.List(ee.Dictionary(C2_RADIANCE_BANDS).get(satellite))
         output_bands = ['blue', 'green', 'red', 'nir', 'swir1', 'swir2', 'thermal']
 
-        add_thermal_properties = ee.Dictionary({
-            'LANDSAT_4': 'RADIANCE_ADD_BAND_6',
-            'LANDSAT_5': 'RADIANCE_ADD_BAND_6',
-            'LANDSAT_7': 'RADIANCE_ADD_BAND_6_VCID_1',
-            'LANDSAT_8': 'RADIANCE_ADD_BAND_10',
-            'LANDSAT_9': 'RADIANCE_ADD_BAND_10',
-        })
-        mul_thermal_properties = ee.Dictionary({
-            'LANDSAT_4': 'RADIANCE_MULT_BAND_6',
-            'LANDSAT_5': 'RADIANCE_MULT_BAND_6',
-            'LANDSAT_7': 'RADIANCE_MULT_BAND_6_VCID_1',
-            'LANDSAT_8': 'RADIANCE_MULT_BAND_10',
-            'LANDSAT_9': 'RADIANCE_MULT_BAND_10',
-        })
-        add_thermal_prop = ee.String(add_thermal_properties.get(satellite))
-        mul_thermal_prop = ee.String(mul_thermal_properties.get(satellite))
-
-        return (
-            matched_img
-            .select(ee.List(input_bands.get(satellite)), output_bands)
-            .set({
-                'RADIANCE_ADD_BAND_thermal': ee.Number(matched_img.get(add_thermal_prop)),
-                'RADIANCE_MULT_BAND_thermal': ee.Number(matched_img.get(mul_thermal_prop)),
-            })
-        )
+        return matched_img.select(input_bands, output_bands)
 
     # Rebuilding the coll2 image here since the extra bands needed for the calculation
     #   will likely have been dropped or excluded before getting to this function
-    coll2 = get_matched_c2_t1_image(sr_image)
-    coll2RT = get_matched_c2_t1_radiance_image(sr_image)
+    # Build the system:index format scene ID from the LANDSAT_PRODUCT_ID once
+    #   since it is the same for both of the matched images
+    scene_id = ee.List(ee.String(sr_image.get('LANDSAT_PRODUCT_ID')).split('_'))
+    scene_id = (
+        ee.String(scene_id.get(0)).cat('_').cat(ee.String(scene_id.get(2)))
+        .cat('_').cat(ee.String(scene_id.get(3)))
+    )
+    # scene_id = ee.String(sr_image.get('system:index'))
+
+    coll2 = get_matched_c2_t1_image(sr_image, scene_id)
+    coll2RT = get_matched_c2_t1_radiance_image(sr_image, scene_id)
+
+    # Thermal band radiance rescaling factors for the spacecraft
+    # The values are read directly from the matched image properties
+    #   instead of being copied to generic "thermal" properties first
+    rad_add = ee.Number(coll2RT.get(ee.String(
+        ee.Dictionary(C2_RADIANCE_ADD_THERMAL_PROPERTIES).get(spacecraft_id)
+    )))
+    rad_mult = ee.Number(coll2RT.get(ee.String(
+        ee.Dictionary(C2_RADIANCE_MULT_THERMAL_PROPERTIES).get(spacecraft_id)
+    )))
 
     # Apply Allen-Kilic Eq. 5 to calc. ASTER emiss. for Landsat
     # This is Eq. 4 of Malakar et al., 2018
-    ged_emis = (
-        ged.select(['emissivity_band13']).multiply(0.001)
-        .multiply(ee.Number(c13.get(spacecraft_id)))
-        .add(ged.select(['emissivity_band14']).multiply(0.001)
-             .multiply(ee.Number(c14.get(spacecraft_id))))
-        .add(ee.Number(c.get(spacecraft_id)))
+    ged_emis = ged.expression(
+        '(b13 * c13 + b14 * c14) * 0.001 + c',
+        {
+            'b13': ged.select(['emissivity_band13']),
+            'b14': ged.select(['emissivity_band14']),
+            'c13': c13,
+            'c14': c14,
+            'c': c,
+        }
     )
 
     # Apply Eq. 4 and 3 of Allen-Kilic to estimate the ASTER emissivity for bare soil
     # (this is Eq. 5 of Malakar et al., 2018) with settings by Allen-Kilic.
     # This uses NDVI of ASTER over the same period as ASTER emissivity.
-    fc_aster = ged.select(['ndvi']).multiply(0.01).subtract(0.15).divide(0.65).clamp(0, 1.0)
+    fc_aster = fractional_cover(ged.select(['ndvi']), scale=0.01)
 
     # The 0.9798 is average from ASTER spectral response for bands 13/14 for vegetation
     #   derived from Glynn Hulley (2023)
-    # CGM - Reordered equation to avoid needing a constant image that would not have a projection
-    #   X.multiply(-1).add(1) is equivalent to "1-X" or ee.Image.constant(1).subtract(X)
-    em_soil = ged_emis.subtract(fc_aster.multiply(0.9798)).divide(fc_aster.multiply(-1).add(1))
-
+    # Computing "1-fc" in the expression avoids needing a constant image
+    #   that would not have a projection
     # Added accounting for instability in (1-fc_ASTER) denominator when fc_ASTER is large
     # by fixing bare component to spectral library emissivity of soil
-    em_soil = em_soil.where(fc_aster.gt(0.8), soil_emiss_fill)
+    em_soil = ged_emis.expression(
+        '(fc > 0.8) ? soil_emiss_fill : (emis - fc * 0.9798) / (1 - fc)',
+        {'emis': ged_emis, 'fc': fc_aster, 'soil_emiss_fill': soil_emiss_fill}
+    )
 
     # Fill in soil emissivity gaps using the default value
     # CGM - Not sure if the sameFootprint parameter is needed or does anything
@@ -410,28 +541,40 @@ def landsat_c2_sr_lst_correct(sr_image, ndvi):
     # Using the ASTER-based soil emissivity from above
     # The following estimate for emissivity to use with Landsat may need to be clamped
     #   to some predefined safe limits (for example, 0.5 and 1.0).
-    # CGM - Is the .multiply(1.0) needed?
-    fc_landsat = ndvi.multiply(1.0).subtract(0.15).divide(0.65).clamp(0, 1.0)
+    fc_landsat = fractional_cover(ndvi)
 
     # calc_smoothed_em_soil
-    LS_EM = fc_landsat.multiply(-1).add(1).multiply(em_soil).add(fc_landsat.multiply(veg_emis))
+    # Computing "1-fc" in the expression avoids needing a constant image
+    LS_EM = fc_landsat.expression(
+        '(1 - fc) * em_soil + fc * veg_emis',
+        {'fc': fc_landsat, 'em_soil': em_soil, 'veg_emis': veg_emis},
+    )
 
     # Apply Eq. 8 to get thermal surface radiance, Rc, from C2 Real time band 10
     # (Eq. 7 of Malakar et al. but without the emissivity to produce actual radiance)
-    Rc = (
-        coll2RT.select(['thermal'])
-        .multiply(ee.Number(coll2RT.get('RADIANCE_MULT_BAND_thermal')))
-        .add(ee.Number(coll2RT.get('RADIANCE_ADD_BAND_thermal')))
-        .subtract(coll2.select(['ST_URAD']).multiply(0.001))
-        .divide(coll2.select(['ST_ATRAN']).multiply(0.0001))
-        .subtract(LS_EM.multiply(-1).add(1).multiply(coll2.select(['ST_DRAD']).multiply(0.001)))
+    rc_expr = (
+        '((thermal * rad_mult + rad_add - urad * 0.001) / (atran * 0.0001)'
+        ' - (1 - em) * drad * 0.001)'
     )
 
-    # Apply Eq. 7 to convert Rs to LST (similar to Malakar et al., but with emissivity)
+    # Apply Eq. 7 to convert Rc to LST (similar to Malakar et al., but with emissivity)
+    # Both equations are computed in a single expression call
+    #   to avoid building a separate image for each operation
     return (
-        LS_EM.multiply(ee.Number(k1.get(spacecraft_id)))
-        .divide(Rc).add(1.0).log().pow(-1)
-        .multiply(ee.Number(k2.get(spacecraft_id)))
+        LS_EM.expression(
+            f'k2 / log(em * k1 / {rc_expr} + 1)',
+            {
+                'em': LS_EM,
+                'thermal': coll2RT.select(['thermal']),
+                'rad_mult': rad_mult,
+                'rad_add': rad_add,
+                'urad': coll2.select(['ST_URAD']),
+                'atran': coll2.select(['ST_ATRAN']),
+                'drad': coll2.select(['ST_DRAD']),
+                'k1': k1,
+                'k2': k2,
+            }
+        )
         .rename('lst')
         # .set({'system:time_start': sr_image.get('system:time_start')})
     )
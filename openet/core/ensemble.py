@@ -57,10 +57,12 @@ def mad(ensemble_img, made_scale=2):
     )
 
     ens_array = ensemble_img.unmask(-9999).toArray()
-    diff_array = ens_array.subtract(ens_median)
+    # The absolute difference from the median is the sort key for both
+    #   the value and index arrays, so only build it once
+    sort_keys = ens_array.subtract(ens_median).abs()
 
     mad_img = (
-        ens_array.arraySort(diff_array.abs())
+        ens_array.arraySort(sort_keys)
         .arraySlice(0, 0, mad_count)
         .arrayCat(ee.Array(-9999).repeat(0, model_count), 0)
         .arraySlice(0, 0, model_count)
@@ -90,22 +92,25 @@ def mad(ensemble_img, made_scale=2):
     # band_index = ee.List.sequence(1, model_count)
 
     # Bit encode the models using the model index values
+    # The bit value for each model (2^(index-1)) is computed once from the list
+    #   instead of with a per pixel pow() call after sorting
+    band_bits = band_index.map(lambda x: ee.Number(2).pow(ee.Number(x).subtract(1)))
+
     # Build the index array from the ensemble images so that the index
     #   is masked the same
     index_array = (
-        ensemble_img.multiply(0).add(ee.Image.constant(band_index))
+        ensemble_img.multiply(0).add(ee.Image.constant(band_bits))
         .unmask(-9999).toArray()
     )
     index_img = (
-        index_array.arraySort(diff_array.abs())
+        index_array.arraySort(sort_keys)
         .arraySlice(0, 0, mad_count)
         .arrayCat(ee.Array(-9999).repeat(0, model_count), 0)
         .arraySlice(0, 0, model_count)
         .arrayFlatten([output_bands])
     )
     index_img = index_img.mask(index_img.neq(-9999))
-    index_img = index_img.multiply(0).add(2).pow(index_img.subtract(1))\
-        .reduce(ee.Reducer.sum()).int().rename(['ensemble_mad_index'])
+    index_img = index_img.reduce(ee.Reducer.sum()).int().rename(['ensemble_mad_index'])
     output_img = output_img.addBands(index_img)
 
     return output_img
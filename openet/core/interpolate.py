@@ -123,6 +123,19 @@ def daily(
     # source_coll = ee.ImageCollection(source_coll.map(add_utc0_time_band))
 
     if interp_method.lower() == 'linear':
+        # Build the nodata image that can be placed at the front/back of
+        #   the qm image collections in case the collections are empty
+        # The image is the same for every target image (except for the time_start),
+        #   so it is built once outside of the mapped function
+        # The first source image is used as a template for the band names
+        source_img = source_coll.first()
+        bands = source_img.bandNames()
+        nodata_img = source_img.double().multiply(0).updateMask(0)
+        # Interpolate all bands except the "time" band
+        value_bands = bands.filter(ee.Filter.notEquals('item', 'time'))
+
+        day_ms = 24 * 60 * 60 * 1000
+
         def _linear(image):
             """Linearly interpolate source images to target image time_start(s)
 
@@ -150,38 +163,31 @@ def daily(
             utc0_date = utils.date_0utc(target_date)
             # utc0_time = target_date.update(hour=0, minute=0, second=0)\
             #     .millis().divide(1000).floor().multiply(1000)
-            time_img = ee.Image.constant(utc0_date.millis()).double()
-
-            # Build nodata images/masks that can be placed at the front/back of
-            #   the qm image collections in case the collections are empty
-            bands = source_coll.first().bandNames()
-            prev_qm_mask = (
-                ee.Image.constant(ee.List.repeat(1, bands.length()))
-                .double().rename(bands).updateMask(0)
-                .set({
-                    'system:time_start': utc0_date.advance(-interp_days - 1, 'day').millis(),
-                })
-            )
-            next_qm_mask = (
-                ee.Image.constant(ee.List.repeat(1, bands.length()))
-                .double().rename(bands).updateMask(0)
-                .set({
-                    'system:time_start': utc0_date.advance(interp_days + 2, 'day').millis(),
-                })
-            )
+            # The window offsets are computed directly in milliseconds
+            #   since the 0 UTC dates don't need calendar aware date math
+            utc0_time = utc0_date.millis()
+            time_img = ee.Image.constant(utc0_time).double()
+
+            # Set the nodata image time_start outside of the interpolation window
+            prev_qm_mask = nodata_img.set({
+                'system:time_start': utc0_time.subtract((interp_days + 1) * day_ms),
+            })
+            next_qm_mask = nodata_img.set({
+                'system:time_start': utc0_time.add((interp_days + 2) * day_ms),
+            })
 
             if use_joins:
                 # Build separate mosaics for before and after the target date
                 prev_qm_img = (
                     ee.ImageCollection
-                    .fromImages(ee.List(ee.Image(image).get('prev')))
+                    .fromImages(ee.List(image.get('prev')))
                     .merge(ee.ImageCollection(prev_qm_mask))
                     .sort('system:time_start', True)
                     .mosaic()
                 )
                 next_qm_img = (
                     ee.ImageCollection
-                    .fromImages(ee.List(ee.Image(image).get('next')))
+                    .fromImages(ee.List(image.get('next')))
                     .merge(ee.ImageCollection(next_qm_mask))
                     .sort('system:time_start', False)
                     .mosaic()
@@ -190,12 +196,12 @@ def daily(
                 # Build separate collections for before and after the target date
                 prev_qm_coll = (
                     source_coll
-                    .filterDate(utc0_date.advance(-interp_days, 'day'), utc0_date)
+                    .filterDate(utc0_time.subtract(interp_days * day_ms), utc0_time)
                     .merge(ee.ImageCollection(prev_qm_mask))
                 )
                 next_qm_coll = (
                     source_coll
-                    .filterDate(utc0_date, utc0_date.advance(interp_days + 1, 'day'))
+                    .filterDate(utc0_time, utc0_time.add((interp_days + 1) * day_ms))
                     .merge(ee.ImageCollection(next_qm_mask))
                 )
 
@@ -206,33 +212,23 @@ def daily(
                 prev_qm_img = prev_qm_coll.sort('system:time_start', True).mosaic()
                 next_qm_img = next_qm_coll.sort('system:time_start', False).mosaic()
 
-            # DEADBEEF - It might be easier to interpolate all bands instead of
-            #   separating the value and time bands
-            # prev_value_img = ee.Image(prev_qm_img).double()
-            # next_value_img = ee.Image(next_qm_img).double()
-
-            # Interpolate all bands except the "time" band
-            prev_bands = prev_qm_img.bandNames().filter(ee.Filter.notEquals('item', 'time'))
-            next_bands = next_qm_img.bandNames().filter(ee.Filter.notEquals('item', 'time'))
-            prev_value_img = ee.Image(prev_qm_img.select(prev_bands)).double()
-            next_value_img = ee.Image(next_qm_img.select(next_bands)).double()
-            prev_time_img = ee.Image(prev_qm_img.select('time')).double()
-            next_time_img = ee.Image(next_qm_img.select('time')).double()
+            # Interpolate all bands together (including the "time" band)
+            #   and then drop the "time" band from the interpolated image
+            prev_qm_img = prev_qm_img.double()
+            next_qm_img = next_qm_img.double()
 
             # Fill masked values with values from the opposite image
             # Something like this is needed to ensure there are always two
             #   values to interpolate between
             # For data gaps, this will cause a flat line instead of a ramp
-            prev_time_mosaic = ee.Image(ee.ImageCollection.fromImages([
-                next_time_img, prev_time_img]).mosaic())
-            next_time_mosaic = ee.Image(ee.ImageCollection.fromImages([
-                prev_time_img, next_time_img]).mosaic())
-            prev_value_mosaic = ee.Image(ee.ImageCollection.fromImages([
-                next_value_img, prev_value_img]).mosaic())
-            next_value_mosaic = ee.Image(ee.ImageCollection.fromImages([
-                prev_value_img, next_value_img]).mosaic())
+            # Unmasking with sameFootprint=False is equivalent to mosaicing
+            #   the image on top of the opposite image
+            prev_qm_mosaic = prev_qm_img.unmask(next_qm_img, False)
+            next_qm_mosaic = next_qm_img.unmask(prev_qm_img, False)
 
             # Calculate time ratio of the current image between other cloud free images
+            prev_time_mosaic = prev_qm_mosaic.select(['time'])
+            next_time_mosaic = next_qm_mosaic.select(['time'])
             time_ratio_img = (
                 time_img.subtract(prev_time_mosaic)
                 .divide(next_time_mosaic.subtract(prev_time_mosaic))
@@ -240,8 +236,9 @@ def daily(
 
             # Interpolate values to the current image time
             interp_img = (
-                next_value_mosaic.subtract(prev_value_mosaic)
-                .multiply(time_ratio_img).add(prev_value_mosaic)
+                next_qm_mosaic.subtract(prev_qm_mosaic)
+                .multiply(time_ratio_img).add(prev_qm_mosaic)
+                .select(value_bands)
             )
 
             # Pass the target image back out as a new band
@@ -80,21 +80,66 @@ def c02_qa_pixel_mask(
 
 
     """
-    qa_img = input_img.select(['QA_PIXEL'])
-    mask_img = qa_img.rightShift(3).bitwiseAnd(1).neq(0)
-    #     .Or(qa_img.rightShift(8).bitwiseAnd(3).gte(cloud_confidence))
+    # All of the flags are single bit tests, so build a single bitmask client side
+    #   and test all of the bits with one bitwiseAnd call
+    # Note, the cloud confidence bits (8-9) are not currently used,
+    #   that would need a separate 2-bit comparison test
+    bitmask = c02_qa_pixel_bitmask(
+        cirrus_flag=cirrus_flag,
+        dilate_flag=dilate_flag,
+        shadow_flag=shadow_flag,
+        snow_flag=snow_flag,
+        water_flag=water_flag,
+    )
+
+    return input_img.select(['QA_PIXEL']).bitwiseAnd(bitmask).neq(0).rename(['mask'])
+
+
+def c02_qa_pixel_bitmask(
+        cirrus_flag=False,
+        dilate_flag=False,
+        shadow_flag=True,
+        snow_flag=False,
+        water_flag=False,
+        ):
+    """Landsat Collection 2 QA_PIXEL bitmask of the bits to mask
+
+    Parameters
+    ----------
+    cirrus_flag : bool
+        If true, mask cirrus pixels (the default is False).
+    dilate_flag : bool
+        If true, mask dilated cloud pixels (the default is False).
+    shadow_flag : bool
+        If true, mask shadow pixels (the default is True).
+    snow_flag : bool
+        If true, mask snow pixels (the default is False).
+    water_flag : bool
+        If true, mask water pixels (the default is False).
+
+    Returns
+    -------
+    int
+
+    Notes
+    -----
+    The cloud bit (3) is always set.
+    See c02_qa_pixel_mask() for the full list of QA_PIXEL bits.
+
+    """
+    bitmask = 1 << 3
     if cirrus_flag:
-        mask_img = mask_img.Or(qa_img.rightShift(2).bitwiseAnd(1).neq(0))
+        bitmask |= 1 << 2
     if dilate_flag:
-        mask_img = mask_img.Or(qa_img.rightShift(1).bitwiseAnd(1).neq(0))
+        bitmask |= 1 << 1
     if shadow_flag:
-        mask_img = mask_img.Or(qa_img.rightShift(4).bitwiseAnd(1).neq(0))
+        bitmask |= 1 << 4
     if snow_flag:
-        mask_img = mask_img.Or(qa_img.rightShift(5).bitwiseAnd(1).neq(0))
+        bitmask |= 1 << 5
     if water_flag:
-        mask_img = mask_img.Or(qa_img.rightShift(7).bitwiseAnd(1).neq(0))
+        bitmask |= 1 << 7
 
-    return mask_img.rename(['mask'])
+    return bitmask
 
 
 def c02_cloud_score_mask(input_img, cloud_score_pct=100):
@@ -150,18 +195,19 @@ def c02_qa_radsat_mask(input_img):
     """
 
     # Use the QA_RADSAT band to mask if saturated in any of the RGB bands
-    # The RGB bands in Landsat 8/9 are shifted over 1 because of the cirrus band
+    # The RGB bands in Landsat 8/9 are shifted over 1 because of the cirrus band,
+    #   so the bitmask is shifted instead of the QA_RADSAT values
     # Use the SPACECRAFT_ID property identify each Landsat type
     spacecraft_id = ee.String(input_img.get('SPACECRAFT_ID'))
-    bitshift = ee.Dictionary({
-        'LANDSAT_4': 0, 'LANDSAT_5': 0, 'LANDSAT_7': 0, 'LANDSAT_8': 1, 'LANDSAT_9': 1,
+    bitmask = ee.Dictionary({
+        'LANDSAT_4': 7, 'LANDSAT_5': 7, 'LANDSAT_7': 7, 'LANDSAT_8': 7 << 1, 'LANDSAT_9': 7 << 1,
     })
     return (
         input_img.select(['QA_RADSAT'], ['mask'])
-        .rightShift(ee.Number(bitshift.get(spacecraft_id)))
-        .bitwiseAnd(7).gt(0)
+        .bitwiseAnd(ee.Number(bitmask.get(spacecraft_id))).gt(0)
         # This will mask if saturated in "all" RGB bands instead of "any" RGB band
-        # .bitwiseAnd(7).gte(7)
+        # .bitwiseAnd(ee.Number(bitmask.get(spacecraft_id)))
+        # .eq(ee.Number(bitmask.get(spacecraft_id)))
     )
 
     # # Mask if saturated in any band
@@ -198,15 +244,15 @@ def c02_l2_sr_cloud_qa_mask(input_img, adjacent_flag=True, shadow_flag=True, sno
         # Bit 0: Dark Dense Vegetation (DDV)
         # Bit 1: Cloud, Bit 2: Cloud Shadow, Bit 3: Adjacent to Cloud
         # Bit 4: Snow, Bit 5: Water
-        mask_img = sr_cloud_qa_img.rightShift(1).bitwiseAnd(1).neq(0)
+        bitmask = 1 << 1
         if shadow_flag:
-            mask_img = mask_img.Or(sr_cloud_qa_img.rightShift(2).bitwiseAnd(1).neq(0))
+            bitmask |= 1 << 2
         if adjacent_flag:
-            mask_img = mask_img.Or(sr_cloud_qa_img.rightShift(3).bitwiseAnd(1).neq(0))
+            bitmask |= 1 << 3
         if snow_flag:
-            mask_img = mask_img.Or(sr_cloud_qa_img.rightShift(4).bitwiseAnd(1).neq(0))
+            bitmask |= 1 << 4
 
-        return mask_img
+        return sr_cloud_qa_img.bitwiseAnd(bitmask).neq(0)
 
     def sr_cloud_qa_l89(sr_cloud_qa_img):
         # There is no SR_CLOUD_QA band in the Landsat 8/9 images
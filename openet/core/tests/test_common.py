@@ -66,6 +66,69 @@ def test_landsat_c2_sr_cloud_mask(qa_pixel, qa_radsat, input_args, expected):
     assert utils.constant_image_value(output_img)['cloud_mask'] == expected
 
 
+@pytest.mark.parametrize(
+    "xy, expected",
+    [
+        # The QA_RADSAT band is masked west of the prime meridian,
+        #   so the combined cloud mask should also be masked there
+        [[-1, 0], None],
+        [[1, 0], 1],
+    ]
+)
+def test_landsat_c2_sr_cloud_mask_partially_masked(xy, expected):
+    radsat_img = (
+        ee.Image.constant(0)
+        .updateMask(ee.Image.pixelLonLat().select(['longitude']).gte(0))
+    )
+    input_img = (
+        ee.Image.constant(0).addBands(radsat_img)
+        .rename(['QA_PIXEL', 'QA_RADSAT'])
+        .set({'SPACECRAFT_ID': 'LANDSAT_8'})
+    )
+    output_img = common.landsat_c2_sr_cloud_mask(input_img, saturated_flag=True)
+    assert utils.point_image_value(output_img, xy, scale=30)['cloud_mask'] == expected
+
+
+@pytest.mark.parametrize(
+    "qa_pixel, input_args, expected",
+    [
+        ['0000000000000000', {}, True],
+        ['0000000000001000', {}, False],  # Cloud
+        ['0000000000010000', {}, False],  # Shadow (default is True)
+        ['0000000000010000', {'shadow_flag': False}, True],
+        ['0000000000000010', {'dilate_flag': True}, False],
+        ['0000000000000100', {'cirrus_flag': True}, False],
+        ['0000000000100000', {}, True],  # Snow (default is False)
+        ['0000000000100000', {'snow_flag': True}, False],
+        ['0000000010000000', {'water_flag': True}, False],
+    ]
+)
+def test_landsat_c2_sr_cloud_mask_np(qa_pixel, input_args, expected):
+    output = common.landsat_c2_sr_cloud_mask_np(int(qa_pixel, 2), **input_args)
+    assert output == expected
+
+
+@pytest.mark.parametrize(
+    "sr_cloud_qa, spacecraft_id, expected",
+    [
+        ['0000000000000000', 'LANDSAT_7', 1],
+        ['0000000000000010', 'LANDSAT_7', 0],  # Cloud
+        ['0000000000000010', 'LANDSAT_5', 0],
+        # SR_CLOUD_QA mask is not applied for Landsat 8/9
+        ['0000000000000010', 'LANDSAT_8', 1],
+        ['0000000000000010', 'LANDSAT_9', 1],
+    ]
+)
+def test_landsat_c2_sr_cloud_mask_sr_cloud_qa(sr_cloud_qa, spacecraft_id, expected):
+    input_img = (
+        ee.Image.constant([int('0000000000000000', 2), int(sr_cloud_qa, 2)])
+        .rename(['QA_PIXEL', 'SR_CLOUD_QA'])
+        .set({'SPACECRAFT_ID': spacecraft_id})
+    )
+    output_img = common.landsat_c2_sr_cloud_mask(input_img, sr_cloud_qa_flag=True)
+    assert utils.constant_image_value(output_img)['cloud_mask'] == expected
+
+
 # TODO: Rework this test to just check if a mask is returned since the
 #   actual value testing is being checked in the landsat module function test
 @pytest.mark.parametrize(
@@ -93,9 +156,9 @@ def test_landsat_c2_sr_cloud_mask_cloud_score(image_id, xy, cloud_score, expecte
         ['0000100000000000', 0],
     ]
 )
-def test_sentinel2_toa_cloud_mask(img_value, expected):
+def test_sentinel2_cloud_mask(img_value, expected):
     input_img = ee.Image.constant(int(img_value, 2)).rename(['QA60'])
-    output_img = common.sentinel2_toa_cloud_mask(input_img)
+    output_img = common.sentinel2_cloud_mask(input_img)
     assert utils.constant_image_value(ee.Image(output_img))['cloud_mask'] == expected
 
 
@@ -113,12 +176,28 @@ def test_sentinel2_sr_cloud_mask(img_value, expected):
     assert utils.constant_image_value(ee.Image(output_img))['cloud_mask'] == expected
 
 
-# def test_sentinel2_toa_cloud_mask_deprecation():
-#     """Test that sentinel2_toa_cloud_mask returns a deprecation warning"""
-#     with pytest.deprecated_call():
-#         input_img = ee.Image.constant(int('0000010000000000', 2)).rename(['QA60'])
-#         output_img = common.sentinel2_toa_cloud_mask(input_img)
-#         assert utils.constant_image_value(ee.Image(output_img))['QA60'] == 0
+@pytest.mark.parametrize(
+    "img_value, expected",
+    [
+        [0, 1],
+        [49, 1],
+        [50, 0],
+        [100, 0],
+    ]
+)
+def test_sentinel2_sr_cloud_mask_cloud_probability(img_value, expected):
+    # Check that the MSK_CLDPRB band is used when the QA60 band is not present
+    input_img = ee.Image.constant(img_value).rename(['MSK_CLDPRB'])
+    output_img = common.sentinel2_sr_cloud_mask(input_img)
+    assert utils.constant_image_value(ee.Image(output_img))['cloud_mask'] == expected
+
+
+def test_sentinel2_toa_cloud_mask_deprecation():
+    """Test that sentinel2_toa_cloud_mask returns a deprecation warning"""
+    with pytest.deprecated_call():
+        input_img = ee.Image.constant(int('0000010000000000', 2)).rename(['QA60'])
+        output_img = common.sentinel2_toa_cloud_mask(input_img)
+        assert utils.constant_image_value(ee.Image(output_img))['cloud_mask'] == 0
 
 
 def test_landsat_c2_sr_lst_correct():
@@ -179,6 +258,23 @@ def test_landsat_c2_sr_lst_correct_values(image_id, xy, expected, uncorrected, t
         assert abs(corrected['lst'] - expected) <= tol
 
 
+def test_landsat_c2_sr_lst_correct_image_extent(tol=0.001):
+    # Check that a client side image extent gives the same values as the default
+    input_img = ee.Image('LANDSAT/LC08/C02/T1_L2/LC08_030036_20210725')
+    ndvi_img = input_img.multiply(0.0000275).add(-0.2).normalizedDifference(['SR_B5', 'SR_B4'])
+    xy = [-102.266754, 34.367682]
+    image_extent = utils.get_info(input_img.geometry().bounds(1, 'EPSG:4326'))['coordinates'][0]
+    image_extent = [
+        min(x for x, y in image_extent), min(y for x, y in image_extent),
+        max(x for x, y in image_extent), max(y for x, y in image_extent),
+    ]
+    default_img = common.landsat_c2_sr_lst_correct(input_img, ndvi_img)
+    output_img = common.landsat_c2_sr_lst_correct(input_img, ndvi_img, image_extent=image_extent)
+    expected = utils.point_image_value(default_img, xy, scale=30)['lst']
+    output = utils.point_image_value(output_img, xy, scale=30)['lst']
+    assert abs(output - expected) <= tol
+
+
 def test_landsat_c2_sr_lst_correct_no_toa():
     input_img = ee.Image('LANDSAT/LE07/C02/T1_L2/LE07_030026_20200628')
     output_img = common.landsat_c2_sr_lst_correct(
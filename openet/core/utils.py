@@ -372,6 +372,31 @@ def ee_task_start(task, n=6):
     return task
 
 
+def ee_init_highvolume(project=None, credentials='persistent'):
+    """Initialize Earth Engine using the high volume endpoint
+
+    Parameters
+    ----------
+    project : str, optional
+        Google Cloud project ID to use for the Earth Engine requests.
+    credentials : optional
+        Credentials to pass through to ee.Initialize() (the default is "persistent").
+
+    Notes
+    -----
+    The high volume endpoint is intended for making many concurrent
+    automated requests (e.g. getInfo or getDownloadURL calls in a loop
+    over images that were built by mapping the cloud mask or LST functions)
+    and should not be used for starting export tasks.
+
+    """
+    ee.Initialize(
+        credentials,
+        project=project,
+        opt_url='https://earthengine-highvolume.googleapis.com',
+    )
+
+
 def is_number(x):
     try:
         float(x)
@@ -511,7 +536,7 @@ def str_ranges_2_list(nputstr=""):
                 # not an int and not a range...
                 invalid.add(i)
 
-    return sorted(list(selection))
+    return sorted(selection)
 
 
 def list_2_str_ranges(i):